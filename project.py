@@ -1,74 +1,350 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, simpledialog
+from tkinter import ttk, messagebox, filedialog, simpledialog, font as tkfont
 import json
 import csv
+import io
 import random
 import os
+import array
+import bisect
+import mmap
+import sys
 import logging
+import pickle
+import functools
+import itertools
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    _dumps_line = lambda obj: orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    orjson = None
+    _loads = json.loads
+    _dumps = lambda obj: (json.dumps(obj, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+    _dumps_line = lambda obj: (json.dumps(obj, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; without it quotes.json is parsed in one go
+    ijson = None
 
 # Configuration and constants
-DATA_FILE = 'quotes.json'
+DATA_FILE = 'quotes.jsonl'  # JSON Lines: one quote object per line
+LEGACY_DATA_FILE = 'quotes.json'  # older single-array format, migrated on first load
+CACHE_FILE = 'quotes.cache.pkl'
+CACHE_VERSION = 4
 SETTINGS_FILE = 'settings.json'
 PASTEL_COLORS = ['#FFB3BA', '#FFDFBA', '#BAFFC9', '#BAE1FF']
 DARK_THEME = {'bg': '#2E2E2E', 'fg': '#FFFFFF', 'btn_bg': '#3C3C3C', 'btn_fg': '#FFFFFF'}
 LIGHT_THEME = {'bg': '#FFFFFF', 'fg': '#000000', 'btn_bg': '#E0E0E0', 'btn_fg': '#000000'}
+# ttk styles copied from clam into the baked quote-light/quote-dark themes
+THEMED_STYLES = ('.', 'TButton', 'TLabel', 'TFrame', 'TLabelframe', 'TLabelframe.Label',
+                 'TEntry', 'TCombobox', 'TScrollbar', 'TProgressbar')
+SEARCH_DELAY_MS = 120  # wait this long after the last keystroke before searching
+CSV_CHUNK_ROWS = 4096  # rows formatted in memory per file write on export
+LOAD_BATCH = 500  # quotes added per idle step while quotes.json loads
+POLL_MS = 30  # how often the Tk thread checks on background file work
+SETTINGS_SAVE_DELAY_MS = 500  # settings are written this long after the last change
+MMAP_THRESHOLD = 1 << 20  # data files larger than this are read through mmap
 
 logging.basicConfig(filename='quote_app.log', level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s') #https://stackoverflow.com/questions/13479295/python-using-basicconfig-method-to-log-to-console-and-file got a help from here
 
 
+class Quote:
+    """One quote record; __slots__ avoids a per-quote dict and makes field reads attribute lookups."""
+    __slots__ = ('quote', 'author', 'category', 'rating', '_display')
+
+    def __init__(self, quote, author, category, rating=0):
+        # Authors and categories repeat a lot; interning shares one string per value
+        # and lets the category filter compare with `is`.
+        self.quote = quote
+        self.author = sys.intern(author)
+        self.category = sys.intern(category)
+        self.rating = min(max(int(rating), 0), 5)  # 0 = unrated, else 1-5 stars
+        self._display = None
+
+    def __reduce__(self):
+        """Pickle through __init__ so strings are re-interned when the cache is loaded."""
+        return (Quote, (self.quote, self.author, self.category, self.rating))
+
+    @property
+    def display(self):
+        """List-row text, built on first use and cached until the next update()."""
+        if self._display is None:
+            self._display = f"“{self.quote}” — {self.author}"
+        return self._display
+
+    def update(self, quote, author, category):
+        """Replace the text fields after an edit and drop the cached display text."""
+        self.quote = quote
+        self.author = sys.intern(author)
+        self.category = sys.intern(category)
+        self._display = None
+
+    @classmethod
+    def from_dict(cls, d):
+        """Build a Quote from a stored record; raises KeyError, TypeError or ValueError if it is malformed."""
+        quote, author, category = d['quote'], d['author'], d['category']
+        if not (isinstance(quote, str) and isinstance(author, str) and isinstance(category, str)):
+            raise TypeError("quote, author and category must be strings")
+        return cls(quote, author, category, d.get('rating') or 0)
+
+    def to_dict(self):
+        """Return the dict form written to quotes.json."""
+        return {'quote': self.quote, 'author': self.author, 'category': self.category, 'rating': self.rating}
+
+
+def _read_bytes(path):
+    """Read a whole file with one open, one fstat and normally one read syscall plus the EOF check."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks, total = [], 0
+        # A read may return less than asked (files over 2 GiB, some network/FUSE mounts),
+        # and the file may have grown since fstat, so only an empty read means end of file
+        while True:
+            chunk = os.read(fd, max(size + 1 - total, 1 << 16))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            total += len(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
 def load_json_file(path, default):
     """Load JSON from path or return default if failed."""
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _loads(_read_bytes(path))
     except Exception as e:
         logging.warning(f"Could not load {path}: {e}")
         return default
 
 
+def read_json_mapped(path):
+    """Parse the JSON file at path, through a read-only mmap (zero-copy with orjson) when it is large.
+
+    Read and parse errors propagate to the caller.
+    """
+    if os.stat(path).st_size <= MMAP_THRESHOLD:
+        return _loads(_read_bytes(path))
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if orjson is not None:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+        return _loads(mm[:])
+
+
 def save_json_file(path, data):
-    """Save data as JSON to path. Returns True on success."""
+    """Save data as JSON to path atomically (temp file + rename). Returns True on success."""
+    tmp = path + '.tmp'
+    try:
+        buf = _dumps(data)
+        with open(tmp, 'wb') as f:
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        return True
+    except Exception as e:
+        logging.error(f"Error saving {path}: {e}")
+        return False
+
+
+def load_json_stream(path):
+    """Yield the items of the JSON array at path one at a time (incrementally if ijson is installed).
+
+    A missing file yields nothing; a file that can't be read or parsed raises, so the
+    caller can tell it apart from an empty collection.
+    """
+    if not os.path.exists(path):
+        return
+    if ijson is None:
+        yield from read_json_mapped(path)
+        return
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, 'item')
+
+
+def load_jsonl(path):
+    """Yield one record per line of the JSON Lines file at path, skipping blank or damaged lines."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield from _parse_jsonl(iter(mm.readline, b''), path)
+        else:
+            yield from _parse_jsonl(f, path)
+
+
+def _parse_jsonl(lines, path):
+    """Yield the record on each non-blank line, logging and skipping lines that fail to parse."""
+    for lineno, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield _loads(line)
+        except ValueError as e:
+            logging.warning(f"Skipping bad line {lineno} in {path}: {e}")
+
+
+def quotes_from_records(records, path):
+    """Yield a Quote per stored record, logging and skipping records with missing fields or bad values."""
+    for n, d in enumerate(records, 1):
+        try:
+            yield Quote.from_dict(d)
+        except (KeyError, TypeError, ValueError, OverflowError) as e:
+            logging.warning(f"Skipping bad record {n} in {path}: {e!r}")
+
+
+def save_jsonl(path, records):
+    """Stream records to path as JSON Lines via a temp file + rename. Returns True on success."""
+    tmp = path + '.tmp'
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+        with open(tmp, 'wb') as f:
+            f.writelines(map(_dumps_line, records))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
         return True
     except Exception as e:
         logging.error(f"Error saving {path}: {e}")
         return False
 
 
+def append_jsonl(path, records):
+    """Append records to the JSON Lines file at path. Returns True on success."""
+    try:
+        with open(path, 'a+b') as f:
+            end = f.seek(0, os.SEEK_END)
+            if end:
+                f.seek(end - 1)
+                # A torn append or a hand edit can drop the final newline; don't glue onto that line
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+            f.writelines(map(_dumps_line, records))
+            f.flush()
+            os.fsync(f.fileno())
+        return True
+    except Exception as e:
+        logging.error(f"Error appending to {path}: {e}")
+        return False
+
+
+def read_quotes_cache(path, cache_path):
+    """Return (key, cached) where cached is (quotes, categories, authors) or None on a cache miss.
+
+    key is built from the mtime/size of path and is None when path does not exist.
+    """
+    try:
+        st = os.stat(path)
+        key = (CACHE_VERSION, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None, None
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, quotes, categories, authors = pickle.load(f)
+        if cached_key == key:
+            return key, (quotes, categories, authors)
+    except Exception as e:
+        logging.info(f"Quote cache miss for {path}: {e}")
+    return key, None
+
+
+def write_quotes_cache(cache_path, key, quotes, categories, authors):
+    """Pickle quotes and their category/author counts under key."""
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump((key, quotes, categories, authors), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        logging.warning(f"Could not write cache {cache_path}: {e}")
+
+
 def export_to_csv(path, quotes):
     """Export list of quotes to CSV at path. Returns True on success."""
     try:
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(['Quote', 'Author', 'Category', 'Rating'])
         with open(path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Quote', 'Author', 'Category', 'Rating'])
-            for q in quotes:
-                writer.writerow([q['quote'], q['author'], q['category'], q.get('rating', '')])
+            for start in range(0, len(quotes), CSV_CHUNK_ROWS):
+                writer.writerows((q.quote, q.author, q.category, q.rating)
+                                 for q in quotes[start:start + CSV_CHUNK_ROWS])
+                f.write(buf.getvalue())
+                buf.seek(0)
+                buf.truncate()
+            f.write(buf.getvalue())
         return True
     except Exception as e:
         logging.error(f"CSV export failed: {e}")
         return False
 
 
+def _csv_field(row, idx):
+    """Return row[idx], or '' when the column is absent or the row is short."""
+    return row[idx] if idx is not None and idx < len(row) else ''
+
+
+def _parse_rating(value):
+    """Convert a CSV rating cell to int; blanks and junk count as unrated (0)."""
+    try:
+        return int(value or 0)
+    except ValueError:
+        return 0
+
+
+def _import_csv_pandas(pd, path):
+    """Parse the CSV at path with pandas' C reader into (quote, author, category, rating) tuples."""
+    df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding='utf-8')
+    n = len(df)
+
+    def column(name):
+        return df[name].fillna('').str.strip().tolist() if name in df else [''] * n
+
+    ratings = df['Rating'].fillna('').map(_parse_rating).tolist() if 'Rating' in df else [0] * n
+    return list(zip(column('Quote'), column('Author'), column('Category'), ratings))
+
+
 def import_from_csv(path):
-    """Import quotes from CSV at path. Returns list of quote dicts."""
-    imported = []
+    """Import quotes from CSV at path. Returns a list of (quote, author, category, rating) tuples."""
+    try:
+        import pandas as pd  # optional; imported here so it never slows down startup
+    except ImportError:
+        pd = None
+    if pd is not None:
+        try:
+            return _import_csv_pandas(pd, path)
+        except Exception as e:
+            logging.warning(f"pandas could not read {path}, using the csv module: {e}")
     try:
-        with open(path, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                imported.append({
-                    'quote': row.get('Quote', '').strip(),
-                    'author': row.get('Author', '').strip(),
-                    'category': row.get('Category', '').strip(),
-                    'rating': int(row.get('Rating') or 0)
-                })
-        return imported
+        with open(path, 'r', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            qi, ai, ci, ri = (header.index(name) if name in header else None
+                              for name in ('Quote', 'Author', 'Category', 'Rating'))
+            return [(_csv_field(row, qi).strip(), _csv_field(row, ai).strip(),
+                     _csv_field(row, ci).strip(), _parse_rating(_csv_field(row, ri)))
+                    for row in reader if row]
     except Exception as e:
         logging.error(f"CSV import failed: {e}")
-        return imported
+        return []
+
+
+def _baked_theme_settings(style, colors):
+    """Build theme_create settings: clam's options for THEMED_STYLES with the theme colors baked in."""
+    # Derived themes inherit clam's elements and layouts but not its style options, so copy those over
+    settings = {name: {'configure': style.configure(name) or {}, 'map': style.map(name) or {}}
+                for name in THEMED_STYLES}
+    settings['.']['configure'].update(background=colors['bg'], foreground=colors['fg'],
+                                      fieldbackground=colors['bg'], insertcolor=colors['fg'])
+    settings['TButton']['configure'].update(background=colors['btn_bg'], foreground=colors['btn_fg'])
+    settings['TButton']['map']['background'] = [('pressed', colors['bg']), ('active', colors['bg'])]
+    return settings
 
 
 class QuoteApp(tk.Tk):
@@ -81,25 +357,156 @@ class QuoteApp(tk.Tk):
         self.geometry("800x600")
         self.resizable(True, True)
 
-        self.quotes = load_json_file(DATA_FILE, [])
+        self._cache_key, cached = read_quotes_cache(DATA_FILE, CACHE_FILE)
+        self._migrating = self._load_failed = False
+        if cached:
+            self.quotes, self._cat_counts, self._author_counts = cached
+            self._load_stream = None
+        else:
+            # Cache miss: the quote file is streamed in batches once the window is up
+            self.quotes, self._cat_counts, self._author_counts = [], Counter(), Counter()
+            if os.path.exists(DATA_FILE):
+                self._load_stream = quotes_from_records(load_jsonl(DATA_FILE), DATA_FILE)
+            else:
+                self._load_stream = quotes_from_records(load_json_stream(LEGACY_DATA_FILE), LEGACY_DATA_FILE)
+                self._migrating = os.path.exists(LEGACY_DATA_FILE)
+        # Quotes before _saved_count are on disk unchanged, so Save All can just append the rest
+        self._saved_count = self._loaded_count = len(self.quotes)
+        self._rewrite_needed = False
         self.settings = load_json_file(SETTINGS_FILE, {'theme': 'light', 'last_category': ''})
-        self.categories = sorted({q['category'] for q in self.quotes})
-        self.authors = sorted({q['author'] for q in self.quotes})
-        self.filtered = list(self.quotes)
+        self._settings_dirty = False
+        self._settings_after_id = None
+        self._settings_hash = hash(_dumps(self.settings))
+        self._match_indices = functools.lru_cache(maxsize=8)(self._scan_indices)
+        self._search_blob = self._search_starts = None
+        self._by_category = None  # {category: ascending quote indices}, built on first filter
+        self._build_columns()
+        self._cat_sorted = sorted(self._cat_counts)  # kept sorted with bisect as categories come and go
+        self._filter_cat = ''
+        self._set_filtered(range(len(self.quotes)))
         self.edit_mode = False
+        self._current = 0
+        self._color_cycle = itertools.cycle(random.sample(PASTEL_COLORS, len(PASTEL_COLORS)))
+        # One worker keeps file writes in submission order
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._importing = False
 
         self._configure_style()
         self._create_menu()
         self._build_widgets()
+        self._render_list()  # draw now rather than waiting for a <Configure> that changes the row count
+        self._themable = self._themable_widgets()
         self.apply_theme()
+        if self._load_stream is not None:
+            self._load_more()
         self.show_random_quote()
+        self.protocol('WM_DELETE_WINDOW', self._on_close)
+
+    def _build_columns(self):
+        """Build parallel per-field lists (structure of arrays) used by the filter/search scans."""
+        self._q_text_lower, self._q_author_lower, self._q_category = [], [], []
+        self._q_rating = array.array('B')  # one byte per rating instead of an int object
+        self._rated_count = 0
+        self._append_columns(self.quotes)
+
+    def _append_columns(self, quotes):
+        """Append the fields of the given quotes to the column lists (the only column-append loop)."""
+        text_lower, author_lower = self._q_text_lower, self._q_author_lower
+        categories, ratings, by_category = self._q_category, self._q_rating, self._by_category
+        self._columns_changed()
+        for q in quotes:
+            if by_category is not None:
+                by_category[q.category].append(len(categories))
+            text_lower.append(q.quote.lower())
+            author_lower.append(q.author.lower())
+            categories.append(q.category)
+            ratings.append(q.rating)
+            if q.rating:
+                self._rated_count += 1
+
+    def _extend_quotes(self, new_quotes):
+        """Append Quote objects to quotes, columns and counts. Returns how many were added."""
+        new_quotes = list(new_quotes)
+        self.quotes.extend(new_quotes)
+        self._append_columns(new_quotes)
+        for q in new_quotes:
+            self._count_quote(q, 1)
+        return len(new_quotes)
+
+    def _load_more(self):
+        """Add the next LOAD_BATCH quotes from the quote file, rescheduling until it is done."""
+        try:
+            added = self._extend_quotes(itertools.islice(self._load_stream, LOAD_BATCH))
+            self._loaded_count += added
+        except Exception as e:
+            logging.warning(f"Could not load quotes: {e}")
+            added = 0
+            self._load_failed = True
+        if added == LOAD_BATCH:
+            self.after_idle(self._load_more)
+            return
+        self._load_stream = None
+        if self._load_failed:
+            # Never cache, migrate or save over a partial load; save_all refuses to write
+            logging.error(f"Only {len(self.quotes)} quotes loaded; saving is disabled this session")
+        elif self._migrating:
+            if save_jsonl(DATA_FILE, (q.to_dict() for q in self.quotes)):
+                logging.info(f"Migrated {LEGACY_DATA_FILE} to {DATA_FILE}")
+                self._saved_count = len(self.quotes)
+            else:
+                self._rewrite_needed = True
+        else:
+            self._saved_count = self._loaded_count
+            if self._cache_key is not None:
+                write_quotes_cache(CACHE_FILE, self._cache_key, self.quotes, self._cat_counts, self._author_counts)
+        # Search and filter stay usable while loading; re-run whichever is active over the full list
+        if self.search_var.get().strip():
+            self.search_quotes()
+        else:
+            self._set_filtered(self._match_indices(self._filter_cat, ''))
+            self.refresh_list()
+
+    def _columns_changed(self):
+        """Drop results derived from the columns: memoized matches and the search blob."""
+        self._match_indices.cache_clear()
+        self._search_blob = self._search_starts = None
+
+    def _set_columns(self, idx, q):
+        """Overwrite the column entries at idx with the fields of q."""
+        self._columns_changed()
+        old = self._q_category[idx]
+        if self._by_category is not None and old != q.category:
+            members = self._by_category[old]
+            del members[bisect.bisect_left(members, idx)]
+            if not members:
+                del self._by_category[old]
+            bisect.insort(self._by_category[q.category], idx)
+        self._q_text_lower[idx] = q.quote.lower()
+        self._q_author_lower[idx] = q.author.lower()
+        self._q_category[idx] = q.category
+        self._rated_count += bool(q.rating) - bool(self._q_rating[idx])
+        self._q_rating[idx] = q.rating
+
+    def _delete_columns(self, idx):
+        """Drop the column entries at idx."""
+        self._columns_changed()
+        self._by_category = None  # every later index shifts; rebuild lazily on the next filter
+        if self._q_rating[idx]:
+            self._rated_count -= 1
+        del self._q_text_lower[idx]
+        del self._q_author_lower[idx]
+        del self._q_category[idx]
+        del self._q_rating[idx]
 
     def _configure_style(self):
         """Configure ttk styles for consistency."""
-        style = ttk.Style(self)
+        self.style = style = ttk.Style(self)
         style.theme_use('clam')
         style.configure('TButton', font=('Helvetica', 11), padding=5)
         style.configure('TLabel', font=('Helvetica', 11))
+        # Both themes are built once here, so switching is a single theme_use call
+        for name, colors in (('quote-light', LIGHT_THEME), ('quote-dark', DARK_THEME)):
+            style.theme_create(name, parent='clam', settings=_baked_theme_settings(style, colors))
 
     def _create_menu(self):
         """Build the application menu bar."""
@@ -109,7 +516,7 @@ class QuoteApp(tk.Tk):
         file_menu.add_command(label='Export CSV', command=self.export_csv)
         file_menu.add_separator()
         file_menu.add_command(label='Save', command=self.save_all)
-        file_menu.add_command(label='Exit', command=self.quit)
+        file_menu.add_command(label='Exit', command=self._on_close)
         menubar.add_cascade(label='File', menu=file_menu)
 
         view_menu = tk.Menu(menubar, tearoff=0)
@@ -172,7 +579,8 @@ class QuoteApp(tk.Tk):
         self.category_var = tk.StringVar(value=self.settings.get('last_category',''))
         self.category_combo = ttk.Combobox(
             filter_pane, textvariable=self.category_var,
-            values=self.categories, state='readonly'
+            values=tuple(self._cat_sorted), state='readonly',
+            postcommand=self._update_category_values
         )
         self.category_combo.pack(fill='x', padx=5)
         filter_button = ttk.Button(filter_pane, text='Filter!', command=self.filter_quotes)
@@ -180,6 +588,8 @@ class QuoteApp(tk.Tk):
 
         ttk.Label(filter_pane, text='Look for Something:').pack(anchor='w', padx=5, pady=2)
         self.search_var = tk.StringVar()
+        self._search_after = None
+        self.search_var.trace_add('write', self._schedule_search)
         search_entry = ttk.Entry(filter_pane, textvariable=self.search_var)
         search_entry.pack(fill='x', padx=5)
         search_button = ttk.Button(filter_pane, text='Find It', command=self.search_quotes)
@@ -187,9 +597,26 @@ class QuoteApp(tk.Tk):
 
         list_pane = ttk.Frame(middle)
         list_pane.pack(side='right', fill='both', expand=True)
-        self.listbox = tk.Listbox(list_pane, font=('Arial', 11))
+        # The listbox only ever holds the rows that fit on screen; the scrollbar
+        # moves a window (_list_top) over self.filtered instead of scrolling Tk's copy.
+        self.list_scroll = ttk.Scrollbar(list_pane, orient='vertical', command=self._on_list_scroll)
+        self.list_scroll.pack(side='right', fill='y')
+        self.listbox = tk.Listbox(list_pane, font=('Arial', 11), exportselection=False)
         self.listbox.pack(fill='both', expand=True)
         self.listbox.bind('<<ListboxSelect>>', self.on_select) #.../// LIke twhat hapoens dwhen you clicdk the quote
+        self.listbox.bind('<Configure>', self._on_list_resize)
+        self.listbox.bind('<MouseWheel>', self._on_list_wheel)
+        self.listbox.bind('<Button-4>', self._on_list_wheel)
+        self.listbox.bind('<Button-5>', self._on_list_wheel)
+        # Same geometry Tk uses: linespace + 1 + select border per row, inside border + highlight
+        lb = self.listbox
+        self._row_height = (tkfont.Font(self, font=('Arial', 11)).metrics('linespace') + 1
+                            + 2 * lb.winfo_pixels(lb.cget('selectborderwidth')))
+        self._list_inset = 2 * (lb.winfo_pixels(lb.cget('borderwidth'))
+                                + lb.winfo_pixels(lb.cget('highlightthickness')))
+        self._list_top = 0
+        self._list_rows = 10
+        self._selected = None
 
     def _build_bottom_frame(self):
         """The bottom bit where we can mess with adding, editing, and deleting."""
@@ -216,25 +643,64 @@ class QuoteApp(tk.Tk):
         delete_button.grid(row=2, column=2)
         save_button = ttk.Button(bottom, text=' Save Everything', command=self.save_all)
         save_button.grid(row=2, column=3)
+        # Shown only while a CSV import is being parsed in the background
+        self.import_progress = ttk.Progressbar(bottom, mode='indeterminate')
+        self.import_progress.grid(row=3, column=0, columnspan=4, sticky='ew', pady=(0, 5))
+        self.import_progress.grid_remove()
 
     def apply_theme(self):
         """Apply light or dark theme based on settings."""
         theme = self.settings.get('theme','light')
         colors = LIGHT_THEME if theme=='light' else DARK_THEME
+        self.style.theme_use('quote-light' if theme=='light' else 'quote-dark')
         self.configure(bg=colors['bg'])
-        for widget in self.winfo_children():
-            try:
-                widget.configure(bg=colors['bg'], fg=colors['fg'])
-            except:
-                pass
+        for widget in self._themable:
+            widget.configure(bg=colors['bg'], fg=colors['fg'])
+
+    def _themable_widgets(self):
+        """Collect the plain tk widgets that take bg/fg, once, so apply_theme needn't probe every widget."""
+        found, stack = [], list(self.winfo_children())
+        while stack:
+            widget = stack.pop()
+            stack.extend(widget.winfo_children())
+            options = widget.keys()
+            # quote_label keeps its per-quote pastel background
+            if widget is not self.quote_label and 'bg' in options and 'fg' in options:
+                found.append(widget)
+        return found
 
     def toggle_theme(self):
         """Switch between light and dark themes and save setting."""
         current = self.settings.get('theme','light')
         self.settings['theme'] = 'dark' if current=='light' else 'light'
-        save_json_file(SETTINGS_FILE, self.settings)
+        self._schedule_settings_save()
         self.apply_theme()
 
+    def _schedule_settings_save(self):
+        """Mark settings dirty and (re)start the timer, so a burst of changes is written once."""
+        self._settings_dirty = True
+        if self._settings_after_id is not None:
+            self.after_cancel(self._settings_after_id)
+        self._settings_after_id = self.after(SETTINGS_SAVE_DELAY_MS, self._flush_settings)
+
+    def _flush_settings(self):
+        """Write settings.json if it changed since the last write."""
+        if self._settings_after_id is not None:
+            self.after_cancel(self._settings_after_id)
+            self._settings_after_id = None
+        if not self._settings_dirty:
+            return
+        self._settings_dirty = False
+        new_hash = hash(_dumps(self.settings))
+        if new_hash != self._settings_hash and save_json_file(SETTINGS_FILE, self.settings):
+            self._settings_hash = new_hash
+
+    def _on_close(self):
+        """Flush pending settings, wait for background saves and close the window."""
+        self._flush_settings()
+        self._pool.shutdown(wait=True)
+        self.destroy()
+
     def show_random_quote(self):
         """Display a random quote from the list."""
         if not self.quotes:
@@ -257,11 +723,20 @@ class QuoteApp(tk.Tk):
         """Update the quote label to show the quote at index."""
         self._current = index
         q = self.quotes[index]
-        bg = random.choice(PASTEL_COLORS)
-        self.quote_label.config(text=f'“{q["quote"]}”\n\n— {q["author"]}', bg=bg)
+        bg = next(self._color_cycle)
+        self.quote_label.config(text=f'“{q.quote}”\n\n— {q.author}', bg=bg)
+
+    def _still_loading(self, title):
+        """Warn and return True while the quote file is still being loaded in batches."""
+        if self._load_stream is None:
+            return False
+        messagebox.showwarning(title, "Quotes are still loading, try again in a moment.")
+        return True
 
     def add_or_save(self):
         """Add a new quote or save edits depending on edit_mode."""
+        if self._still_loading("Save" if self.edit_mode else "Add"):
+            return
         text = 'Save' if self.edit_mode else 'Add'
         if self.edit_mode:
             self._save_edit()
@@ -278,80 +753,251 @@ class QuoteApp(tk.Tk):
         if not (quote and author and category):
             messagebox.showwarning("Error", "All fields are required.")
             return
-        new_q = {'quote': quote, 'author': author, 'category': category, 'rating': 0}
-        self.quotes.append(new_q)
-        self._refresh_categories()
+        new_q = Quote(quote, author, category)
+        self._extend_quotes([new_q])
         self.filtered.append(new_q)
-        self.listbox.insert(tk.END, f"“{quote}” — {author}")
+        self._filtered_idx.append(len(self.quotes) - 1)
+        self._render_list()
         self._clear_inputs()
         logging.info(f"Added quote: {quote}")
 
     def prepare_edit(self):
         """Populate inputs for editing the selected quote."""
-        sel = self.listbox.curselection()
-        if not sel:
+        if self._still_loading("Edit"):
+            return
+        idx = self._selected
+        if idx is None:
             messagebox.showwarning("Edit", "Select a quote first.")
             return
-        idx = sel[0]
         q = self.filtered[idx]
-        self.new_quote_var.set(q['quote'])
-        self.new_author_var.set(q['author'])
-        self.new_category_var.set(q['category'])
-        self._edit_index = self.quotes.index(q)
+        self.new_quote_var.set(q.quote)
+        self.new_author_var.set(q.author)
+        self.new_category_var.set(q.category)
+        self._edit_index = self._filtered_idx[idx]
+        self._edit_row = idx
         self.add_button.config(text='💾 Save')
         self.edit_mode = True
 
     def _save_edit(self):
         """Apply edits to the previously selected quote."""
         idx = self._edit_index
-        self.quotes[idx]['quote'] = self.new_quote_var.get().strip()
-        self.quotes[idx]['author'] = self.new_author_var.get().strip()
-        self.quotes[idx]['category'] = self.new_category_var.get().strip()
-        self.refresh_list()
+        q = self.quotes[idx]
+        self._count_quote(q, -1)
+        q.update(self.new_quote_var.get().strip(), self.new_author_var.get().strip(),
+                 self.new_category_var.get().strip())
+        self._set_columns(idx, q)
+        self._count_quote(q, 1)
+        self._mark_changed(idx)
+        row = self._edit_row
+        if row >= len(self._filtered_idx) or self._filtered_idx[row] != idx:
+            self.refresh_list()  # the list was re-filtered since prepare_edit
+        elif self._filter_cat and q.category != self._filter_cat:
+            # Moved out of the category being shown: drop just this row
+            del self.filtered[row]
+            del self._filtered_idx[row]
+            self._selected = None
+            self._render_list()
+        else:
+            self._render_row(row)
         self._clear_inputs()
         logging.info(f"Edited quote at index {idx}")
 
     def delete_quote(self):
         """Remove the selected quote from data and list."""
-        sel = self.listbox.curselection()
-        if not sel:
+        if self._still_loading("Delete"):
+            return
+        idx = self._selected
+        if idx is None:
             messagebox.showwarning("Delete", "Select a quote to delete.")
             return
-        idx = sel[0]
         q = self.filtered.pop(idx)
-        self.quotes.remove(q)
-        self.listbox.delete(idx)
-        logging.info(f"Deleted quote: {q}")
+        master = self._filtered_idx.pop(idx)
+        self._mark_changed(master)
+        del self.quotes[master]
+        # _filtered_idx is ascending, so only the entries after idx pointed past master
+        fidx = self._filtered_idx
+        for j in range(idx, len(fidx)):
+            fidx[j] -= 1
+        if self.edit_mode:
+            if self._edit_index == master:
+                self._cancel_edit()  # the quote being edited is gone
+            else:
+                if self._edit_index > master:
+                    self._edit_index -= 1
+                if self._edit_row > idx:
+                    self._edit_row -= 1
+        self._delete_columns(master)
+        self._count_quote(q, -1)
+        self._selected = None
+        self._render_list()
+        if self._current > master:
+            self._current -= 1
+        elif self._current == master:
+            # The quote on display was deleted; show the one that took its place
+            if self.quotes:
+                self.display_quote(min(master, len(self.quotes) - 1))
+            else:
+                self._current = 0
+                self.quote_label.config(text="No quotes available!")
+        logging.info(f"Deleted quote: {q.quote}")
+
+    def _cancel_edit(self):
+        """Leave edit mode without saving and empty the input fields."""
+        self.edit_mode = False
+        self.add_button.config(text='➕ Add')
+        for var in (self.new_quote_var, self.new_author_var, self.new_category_var):
+            var.set('')
 
     def filter_quotes(self):
         """Filter quotes by selected category."""
         cat = self.category_var.get().strip()
         self.settings['last_category'] = cat
-        save_json_file(SETTINGS_FILE, self.settings)
-        self.filtered = [q for q in self.quotes if q['category'] == cat] if cat else list(self.quotes)
+        self._schedule_settings_save()
+        self._filter_cat = cat
+        self._set_filtered(self._match_indices(cat, ''))
+        self._list_top = 0
         self.refresh_list()
 
+    def _schedule_search(self, *args):
+        """Debounce search-as-you-type: restart the timer on every keystroke."""
+        if self._search_after is not None:
+            self.after_cancel(self._search_after)
+        self._search_after = self.after(SEARCH_DELAY_MS, self.search_quotes)
+
     def search_quotes(self):
         """Filter quotes by search term in quote text or author."""
+        if self._search_after is not None:
+            self.after_cancel(self._search_after)
+            self._search_after = None
         term = self.search_var.get().strip().lower()
-        self.filtered = [q for q in self.quotes if term in q['quote'].lower() or term in q['author'].lower()]
+        self._filter_cat = ''
+        self._set_filtered(self._match_indices('', term))
+        self._list_top = 0
         self.refresh_list()
 
+    def _scan_indices(self, cat, term):
+        """Return indices of quotes matching category cat and search term (empty matches all)."""
+        idxs = range(len(self._q_category))
+        if cat:
+            idxs = self._category_index().get(cat, ())
+        if term and not cat:
+            return self._find_in_blob(term)
+        if term:
+            text, author = self._q_text_lower, self._q_author_lower
+            idxs = [i for i in idxs if term in text[i] or term in author[i]]
+        return tuple(idxs)
+
+    def _category_index(self):
+        """Return {category: ascending quote indices}, building it if a delete invalidated it."""
+        if self._by_category is None:
+            by_category = defaultdict(list)
+            for i, c in enumerate(self._q_category):
+                by_category[c].append(i)
+            self._by_category = by_category
+        return self._by_category
+
+    def _find_in_blob(self, term):
+        """Return indices of quotes whose lowercased text or author contains term.
+
+        Every quote is one 'text\x1fauthor' row in a single string joined by '\x1e', so
+        str.find skips over non-matching quotes in C; row offsets map a hit back to its index.
+        """
+        if '\x1e' in term or '\x1f' in term:
+            return ()
+        if self._search_blob is None:
+            rows = [t + '\x1f' + a for t, a in zip(self._q_text_lower, self._q_author_lower)]
+            self._search_starts = list(itertools.accumulate((len(r) + 1 for r in rows), initial=0))
+            self._search_blob = '\x1e'.join(rows)
+        blob, starts = self._search_blob, self._search_starts
+        idxs = []
+        pos = blob.find(term)
+        while pos != -1:
+            i = bisect.bisect_right(starts, pos) - 1
+            idxs.append(i)
+            pos = blob.find(term, starts[i + 1])
+        return tuple(idxs)
+
+    def _set_filtered(self, idxs):
+        """Show the quotes at master indices idxs, remembering the index of each row."""
+        self._filtered_idx = list(idxs)
+        self.filtered = [self.quotes[i] for i in self._filtered_idx]
+
     def refresh_list(self):
         """Refresh the listbox display from filtered quotes."""
+        self._selected = None
+        self._render_list()
+
+    def _render_list(self):
+        """Fill the listbox with only the rows of self.filtered that fit in view."""
+        total = len(self.filtered)
+        self._list_top = max(0, min(self._list_top, total - self._list_rows))
+        top, end = self._list_top, self._list_top + self._list_rows
+        lines = [q.display for q in self.filtered[top:end]]
         self.listbox.delete(0, tk.END)
-        for q in self.filtered:
-            self.listbox.insert(tk.END, f"“{q['quote']}” — {q['author']}")
+        if lines:
+            self.listbox.insert(tk.END, *lines)
+        if self._selected is not None and top <= self._selected < end:
+            self.listbox.selection_set(self._selected - top)
+        if total:
+            self.list_scroll.set(top / total, min(end, total) / total)
+        else:
+            self.list_scroll.set(0, 1)
+
+    def _render_row(self, row):
+        """Redraw a single row of self.filtered in place if it is on screen."""
+        pos = row - self._list_top
+        if 0 <= pos < self.listbox.size():
+            q = self.filtered[row]
+            self.listbox.delete(pos)
+            self.listbox.insert(pos, q.display)
+            if self._selected == row:
+                self.listbox.selection_set(pos)
+
+    def _scroll_list_to(self, top):
+        """Move the visible window so that row top is first, re-rendering if it moved."""
+        top = max(0, min(top, len(self.filtered) - self._list_rows))
+        if top != self._list_top:
+            self._list_top = top
+            self._render_list()
+
+    def _on_list_scroll(self, action, amount, unit=None):
+        """Scrollbar callback ('moveto' fraction or 'scroll' n units/pages)."""
+        if action == 'moveto':
+            self._scroll_list_to(int(float(amount) * len(self.filtered)))
+        else:
+            step = self._list_rows if unit == 'pages' else 1
+            self._scroll_list_to(self._list_top + int(amount) * step)
+
+    def _on_list_wheel(self, event):
+        """Scroll the window on mouse wheel (delta on Windows/macOS, buttons 4/5 on X11)."""
+        step = -3 if event.num == 4 or event.delta > 0 else 3
+        self._scroll_list_to(self._list_top + step)
+        return 'break'
+
+    def _on_list_resize(self, event):
+        """Recompute how many rows fit when the listbox is resized."""
+        rows = max(1, (event.height - self._list_inset) // self._row_height)
+        if rows != self._list_rows:
+            self._list_rows = rows
+            self._render_list()
 
     def on_select(self, event):
-        """Handle listbox selection (placeholder)."""
-        pass
+        """Remember which filtered quote is selected, so it survives scrolling."""
+        sel = self.listbox.curselection()
+        if sel:
+            self._selected = self._list_top + sel[0]
 
     def rate_current(self):
         """Prompt user to rate the current quote."""
+        if self._still_loading("Rate Quote"):
+            return
         rating = simpledialog.askinteger("Rate Quote", "Rate 1-5 stars:", minvalue=1, maxvalue=5)
         if rating:
-            self.quotes[self._current]['rating'] = rating
+            self.quotes[self._current].rating = rating
+            if not self._q_rating[self._current]:
+                self._rated_count += 1
+            self._q_rating[self._current] = rating
+            self._mark_changed(self._current)
             logging.info(f"Rated quote {self._current} as {rating}")
             messagebox.showinfo("Thanks!", f"Quote rated {rating} stars.")
 
@@ -370,25 +1016,81 @@ class QuoteApp(tk.Tk):
 
     def import_csv(self):
         """Ask for CSV path and import quotes into the list."""
+        if self._still_loading("Import"):
+            return
+        if self._importing:
+            messagebox.showwarning("Import", "An import is already running.")
+            return
         path = filedialog.askopenfilename(filetypes=[('CSV Files', '*.csv')])
         if path:
-            imported = import_from_csv(path)
-            self.quotes.extend(imported)
-            self._refresh_categories()
-            logging.info(f"Imported {len(imported)} quotes from CSV")
-            messagebox.showinfo("Imported", f"{len(imported)} quotes imported.")
-            self.filter_quotes()
-
-    def _refresh_categories(self):
-        """Update category/autocomplete lists after data change."""
-        self.categories = sorted({q['category'] for q in self.quotes})
-        self.authors = sorted({q['author'] for q in self.quotes})
-        self.category_combo['values'] = self.categories
+            self._importing = True
+            self.import_progress.grid()
+            self.import_progress.start()
+            fut = self._pool.submit(import_from_csv, path)
+            self._poll(fut, self._on_import_done)
+
+    def _on_import_done(self, rows):
+        """Add rows parsed by the background import and refresh the list."""
+        self._importing = False
+        self.import_progress.stop()
+        self.import_progress.grid_remove()
+        count = self._extend_quotes(itertools.starmap(Quote, rows))
+        logging.info(f"Imported {count} quotes from CSV")
+        messagebox.showinfo("Imported", f"{count} quotes imported.")
+        self.filter_quotes()
+
+    def _poll(self, fut, callback):
+        """Wait for fut without blocking Tk, then call callback(result) on the Tk thread."""
+        if fut.done():
+            callback(fut.result())
+        else:
+            self.after(POLL_MS, self._poll, fut, callback)
+
+    def _count_quote(self, q, delta):
+        """Adjust category/author counts for q by delta, dropping keys that reach zero."""
+        if delta > 0 and q.category not in self._cat_counts:
+            bisect.insort(self._cat_sorted, q.category)
+        for counts, key in ((self._cat_counts, q.category), (self._author_counts, q.author)):
+            counts[key] += delta
+            if counts[key] <= 0:
+                del counts[key]
+        if q.category not in self._cat_counts:
+            del self._cat_sorted[bisect.bisect_left(self._cat_sorted, q.category)]
+
+    def _update_category_values(self):
+        """Hand the already-sorted categories to the combobox when its dropdown is opened."""
+        self.category_combo['values'] = tuple(self._cat_sorted)
+
+    def _mark_changed(self, idx):
+        """Record that quote idx was edited/rated/deleted; saved quotes force a full rewrite."""
+        if idx < self._saved_count:
+            self._rewrite_needed = True
 
     def save_all(self):
-        """Save all quotes to JSON file."""
-        if save_json_file(DATA_FILE, self.quotes):
+        """Save quotes in the background, appending new ones or rewriting the file after edits."""
+        if self._still_loading("Save"):
+            return
+        if self._load_failed:
+            messagebox.showwarning("Save", "The quote file could not be read completely, so saving is "
+                                   "turned off to avoid overwriting quotes that did not load. "
+                                   "See quote_app.log for details.")
+            return
+        if self._rewrite_needed or not os.path.exists(DATA_FILE):
+            # Records are built here on the Tk thread so an edit can't land half-written
+            fut = self._pool.submit(save_jsonl, DATA_FILE, [q.to_dict() for q in self.quotes])
+        else:
+            fut = self._pool.submit(append_jsonl, DATA_FILE, [q.to_dict() for q in self.quotes[self._saved_count:]])
+        # Assume success so edits made while the write runs are tracked against the new state
+        self._saved_count = len(self.quotes)
+        self._rewrite_needed = False
+        self._poll(fut, self._on_save_done)
+
+    def _on_save_done(self, ok):
+        """Report the result of a background save."""
+        if ok:
             messagebox.showinfo("Saved", "All changes saved.")
+        else:
+            self._rewrite_needed = True
 
     def show_about(self):
         """Display about dialog."""
@@ -397,16 +1099,16 @@ class QuoteApp(tk.Tk):
     def show_stats(self):
         """Display basic statistics of quote collection."""
         total = len(self.quotes)
-        cats = len(self.categories)
-        authors = len(self.authors)
-        rated = sum(1 for q in self.quotes if q.get('rating', 0) > 0)
+        cats = len(self._cat_counts)
+        authors = len(self._author_counts)
+        rated = self._rated_count
         stats = f"Total Quotes: {total}\nCategories: {cats}\nAuthors: {authors}\nRated: {rated}"
         messagebox.showinfo("Stats", stats)
 
 
 if __name__ == '__main__':
-    if not os.path.exists(DATA_FILE):
-        save_json_file(DATA_FILE, [])
+    if not os.path.exists(DATA_FILE) and not os.path.exists(LEGACY_DATA_FILE):
+        save_jsonl(DATA_FILE, [])
     if not os.path.exists(SETTINGS_FILE):
         save_json_file(SETTINGS_FILE, {'theme': 'light', 'last_category': ''})
     app = QuoteApp()